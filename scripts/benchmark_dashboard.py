@@ -0,0 +1,60 @@
+"""Benchmark the dashboard scatter callback on large synthetic launch tables.
+
+Reports, per row count and render mode, the callback latency (figure build + JSON
+serialization, which is what Dash sends to the browser) and the payload size, both for
+the initial render and for a zoom event that makes the server re-bin a narrower window.
+Zoom events that Plotly handles in the browser are reported as "client-side".
+
+Usage:
+    python scripts/benchmark_dashboard.py --rows 1000 10000 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from dash import no_update
+
+from spacex_landing.dashboard.app import update_scatter_figure
+from spacex_landing.dashboard.synthetic import synthetic_launches
+
+GRAPH = "success-payload-scatter-chart"
+ZOOM = {"xaxis.range[0]": 2000, "xaxis.range[1]": 3000}
+
+
+def time_callback(df, render_mode, relayout_data, triggered_id, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fig = update_scatter_figure(
+            df, "ALL", [0, 10000], relayout_data, triggered_id, render_mode=render_mode
+        )
+        if fig is no_update:
+            return None, 0
+        payload = fig.to_json()
+        best = min(best, time.perf_counter() - start)
+    return best, len(payload)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    events = [("initial", None, "payload-slider"), ("zoom", ZOOM, GRAPH)]
+    print(f"{'rows':>10} {'mode':>6} {'event':>8} {'latency (ms)':>14} {'payload (KB)':>14}")
+    for n in args.rows:
+        df = synthetic_launches(n)
+        for mode in ["svg", "auto"]:
+            for event, relayout_data, triggered_id in events:
+                seconds, size = time_callback(df, mode, relayout_data, triggered_id, args.repeats)
+                if seconds is None:
+                    print(f"{n:>10,} {mode:>6} {event:>8} {'client-side':>14} {'-':>14}")
+                else:
+                    print(f"{n:>10,} {mode:>6} {event:>8} {seconds * 1000:>14.1f} {size / 1024:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
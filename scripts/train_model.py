@@ -20,10 +20,12 @@ def main():
     parser.add_argument("--data", type=str, required=True)
     parser.add_argument("--model_out", type=str, default="models/best_model.joblib")
     parser.add_argument("--metrics_out", type=str, default="reports/metrics.json")
+    parser.add_argument("--cv_repeats", type=int, default=5, help="Repeats of stratified 5-fold CV")
+    parser.add_argument("--n_resamples", type=int, default=2000, help="Bootstrap resamples for CIs")
     args = parser.parse_args()
 
     df = pd.read_csv(args.data)
-    result = train_best_model(df)
+    result = train_best_model(df, cv_repeats=args.cv_repeats, n_resamples=args.n_resamples)
 
     Path(args.model_out).parent.mkdir(parents=True, exist_ok=True)
     joblib.dump(result.best_estimator, args.model_out)
@@ -34,6 +36,8 @@ def main():
         json.dump({"best_model": result.best_name, **result.metrics}, f, indent=2)
 
     print(f"Best model: {result.best_name}")
+    ci = result.metrics["confidence_intervals"]["accuracy"]
+    print(f"Holdout accuracy: {ci['estimate']:.3f} (95% CI {ci['ci_low']:.3f}-{ci['ci_high']:.3f})")
     print(f"Saved model to {args.model_out}")
     print(f"Saved metrics to {args.metrics_out}")
 
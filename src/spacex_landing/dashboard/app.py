@@ -7,11 +7,185 @@ Run:
 from __future__ import annotations
 
 import argparse
+import numpy as np
 import pandas as pd
 import plotly.express as px
-from dash import Dash, dcc, html, Input, Output
+import plotly.graph_objects as go
+from dash import Dash, dcc, html, Input, Output, ctx, no_update
 
-def build_app(df: pd.DataFrame) -> Dash:
+# Above this many filtered rows the scatter switches from SVG to WebGL traces.
+WEBGL_ROW_THRESHOLD = 2000
+# Above this many rows in the visible payload window, points are binned on the server.
+OVERVIEW_MAX_POINTS = 20000
+# Number of payload bins per (booster category, class) pair in the overview.
+OVERVIEW_BINS = 400
+
+SCATTER_TITLE = "Payload vs. Launch Outcome"
+
+
+def _zoom_range(relayout_data):
+    """Extract an x-axis zoom window from Graph ``relayoutData`` (None means full range)."""
+    if not relayout_data or relayout_data.get("xaxis.autorange"):
+        return None
+    if "xaxis.range[0]" in relayout_data and "xaxis.range[1]" in relayout_data:
+        return float(relayout_data["xaxis.range[0]"]), float(relayout_data["xaxis.range[1]"])
+    rng = relayout_data.get("xaxis.range")
+    if isinstance(rng, (list, tuple)) and len(rng) == 2:
+        return float(rng[0]), float(rng[1])
+    return None
+
+
+def _bin_points(df, x_range, bins=OVERVIEW_BINS):
+    """Collapse rows into payload bins per booster category and outcome class.
+
+    Each bin is represented by its mean payload and the number of launches it holds,
+    so the overview keeps the shape of the data with a bounded number of markers.
+    """
+    lo, hi = x_range
+    width = (hi - lo) / bins if hi > lo else 1.0
+    idx = np.clip(((df["Payload Mass (kg)"].to_numpy() - lo) / width).astype(np.int64), 0, bins - 1)
+    return (
+        df.assign(_bin=idx)
+        .groupby(["Booster Version Category", "class", "_bin"], sort=False)
+        .agg(payload=("Payload Mass (kg)", "mean"), count=("class", "size"))
+        .reset_index()
+    )
+
+
+def _filter_launches(df, site="ALL", payload_range=None):
+    """Rows matching the site dropdown and payload slider (rows without a payload are dropped)."""
+    filtered = df[df["Payload Mass (kg)"].notna()]
+    if payload_range is not None:
+        low, high = payload_range
+        filtered = filtered[(filtered["Payload Mass (kg)"] >= low) & (filtered["Payload Mass (kg)"] <= high)]
+    if site != "ALL":
+        filtered = filtered[filtered["Launch Site"] == site]
+    return filtered
+
+
+def _use_webgl(n_rows, render_mode="auto", webgl_threshold=WEBGL_ROW_THRESHOLD):
+    """Whether a filtered table of ``n_rows`` is drawn with WebGL traces rather than SVG."""
+    return render_mode == "webgl" or (render_mode == "auto" and n_rows > webgl_threshold)
+
+
+def make_scatter_figure(
+    df,
+    site="ALL",
+    payload_range=None,
+    x_range=None,
+    render_mode="auto",
+    webgl_threshold=WEBGL_ROW_THRESHOLD,
+    max_points=OVERVIEW_MAX_POINTS,
+    bins=OVERVIEW_BINS,
+):
+    """Build the payload vs. outcome scatter for the current filters.
+
+    ``render_mode`` is ``"svg"`` (always the original ``px.scatter``), ``"webgl"`` (always
+    WebGL traces) or ``"auto"`` (WebGL once the filtered table exceeds ``webgl_threshold``).
+    WebGL traces carry float32/int8 arrays so Plotly serializes them as compact typed arrays,
+    and windows with more than ``max_points`` rows are binned before leaving the server.
+    """
+    filtered = _filter_launches(df, site, payload_range)
+
+    # colors follow the full table so a category keeps its color across filters and modes
+    palette = px.colors.qualitative.Plotly
+    categories = sorted(df["Booster Version Category"].dropna().unique().tolist())
+    colors = {c: palette[i % len(palette)] for i, c in enumerate(categories)}
+
+    if not _use_webgl(len(filtered), render_mode, webgl_threshold):
+        return px.scatter(
+            filtered,
+            x="Payload Mass (kg)",
+            y="class",
+            color="Booster Version Category",
+            category_orders={"Booster Version Category": categories},
+            color_discrete_map=colors,
+            title=SCATTER_TITLE,
+        )
+
+    # only crop to the zoom window when the full table would have to be binned anyway
+    visible = filtered
+    if x_range is not None and len(filtered) > max_points:
+        visible = filtered[
+            (filtered["Payload Mass (kg)"] >= x_range[0]) & (filtered["Payload Mass (kg)"] <= x_range[1])
+        ]
+    binned = len(visible) > max_points
+    if binned:
+        window = x_range or (float(visible["Payload Mass (kg)"].min()), float(visible["Payload Mass (kg)"].max()))
+        points = _bin_points(visible, window, bins=bins)
+        max_count = max(int(points["count"].max()), 1)
+    else:
+        points = visible.rename(columns={"Payload Mass (kg)": "payload"})
+
+    fig = go.Figure()
+    for category, group in points.groupby("Booster Version Category", sort=True):
+        marker = {"color": colors[category]}
+        trace = {
+            "x": group["payload"].to_numpy(dtype=np.float32),
+            "y": group["class"].to_numpy(dtype=np.int8),
+            "name": str(category),
+            "mode": "markers",
+        }
+        if binned:
+            counts = group["count"].to_numpy(dtype=np.int32)
+            marker["size"] = (4 + 12 * np.sqrt(counts / max_count)).astype(np.float32)
+            trace["customdata"] = counts
+            trace["hovertemplate"] = "Payload %{x:.0f} kg<br>class %{y}<br>%{customdata} launches"
+        fig.add_trace(go.Scattergl(marker=marker, **trace))
+
+    title = SCATTER_TITLE + (f" (binned, {len(visible):,} launches)" if binned else "")
+    fig.update_layout(
+        title=title,
+        xaxis_title="Payload Mass (kg)",
+        yaxis_title="class",
+        legend_title_text="Booster Version Category",
+        # keep the user's zoom while the binned traces are refreshed
+        uirevision=f"{site}|{payload_range}",
+    )
+    if x_range is not None:
+        fig.update_xaxes(range=list(x_range))
+    return fig
+
+
+def update_scatter_figure(
+    df,
+    site,
+    payload_range,
+    relayout_data=None,
+    triggered_id=None,
+    render_mode="auto",
+    webgl_threshold=WEBGL_ROW_THRESHOLD,
+    max_points=OVERVIEW_MAX_POINTS,
+    **figure_kwargs,
+):
+    """Body of the scatter callback; ``triggered_id`` is the Dash component that fired it.
+
+    Zoom/pan events (``relayoutData`` from the graph itself) only trigger a redraw when the
+    overview is binned, so the server can re-bin the new window. Otherwise the browser
+    already holds every filtered point and Plotly zooms client-side; returning a fresh
+    figure would only cost a round trip (and reset the axes for SVG).
+    """
+    x_range = None
+    if triggered_id == "success-payload-scatter-chart":
+        n_rows = len(_filter_launches(df, site, payload_range))
+        if not _use_webgl(n_rows, render_mode, webgl_threshold) or n_rows <= max_points:
+            return no_update
+        x_range = _zoom_range(relayout_data)
+        if x_range is None and not (relayout_data or {}).get("xaxis.autorange"):
+            return no_update
+    return make_scatter_figure(
+        df,
+        site,
+        payload_range,
+        x_range=x_range,
+        render_mode=render_mode,
+        webgl_threshold=webgl_threshold,
+        max_points=max_points,
+        **figure_kwargs,
+    )
+
+
+def build_app(df: pd.DataFrame, render_mode: str = "auto") -> Dash:
     app = Dash(__name__)
 
     launch_sites = sorted(df["Launch Site"].dropna().unique().tolist())
@@ -63,18 +237,11 @@ def build_app(df: pd.DataFrame) -> Dash:
         Output("success-payload-scatter-chart", "figure"),
         Input("site-dropdown", "value"),
         Input("payload-slider", "value"),
+        Input("success-payload-scatter-chart", "relayoutData"),
     )
-    def update_scatter(site: str, payload_range):
-        low, high = payload_range
-        filtered = df[(df["Payload Mass (kg)"] >= low) & (df["Payload Mass (kg)"] <= high)]
-        if site != "ALL":
-            filtered = filtered[filtered["Launch Site"] == site]
-        return px.scatter(
-            filtered,
-            x="Payload Mass (kg)",
-            y="class",
-            color="Booster Version Category",
-            title="Payload vs. Launch Outcome",
+    def update_scatter(site: str, payload_range, relayout_data):
+        return update_scatter_figure(
+            df, site, payload_range, relayout_data, ctx.triggered_id, render_mode=render_mode
         )
 
     return app
@@ -84,11 +251,17 @@ def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--data", type=str, required=True, help="Path to spacex_launch_dash.csv")
     parser.add_argument("--port", type=int, default=8050)
+    parser.add_argument(
+        "--render-mode",
+        choices=["auto", "svg", "webgl"],
+        default="auto",
+        help="Scatter rendering: SVG, WebGL, or WebGL above a row threshold (default)",
+    )
     args = parser.parse_args()
 
     df = pd.read_csv(args.data)
-    app = build_app(df)
-    app.run_server(host="0.0.0.0", port=args.port, debug=True)
+    app = build_app(df, render_mode=args.render_mode)
+    app.run(host="0.0.0.0", port=args.port, debug=True)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,23 @@
+"""Synthetic launch tables in the dashboard CSV layout, for benchmarks and tests."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+SITES = ["CCAFS LC-40", "CCAFS SLC-40", "KSC LC-39A", "VAFB SLC-4E"]
+BOOSTERS = ["v1.0", "v1.1", "FT", "B4", "B5"]
+
+
+def synthetic_launches(n, seed=0):
+    """`n` random launches with payloads in 0-10,000 kg and heavier payloads landing more often."""
+    rng = np.random.default_rng(seed)
+    payload = rng.uniform(0, 10000, n)
+    return pd.DataFrame(
+        {
+            "Launch Site": rng.choice(SITES, n),
+            "Payload Mass (kg)": payload,
+            "Booster Version Category": rng.choice(BOOSTERS, n),
+            "class": (rng.random(n) < 0.4 + payload / 25000).astype(int),
+        }
+    )
@@ -0,0 +1,146 @@
+"""Resampling-based evaluation: repeated stratified CV and vectorized bootstrap intervals."""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+import numpy as np
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.model_selection import RepeatedStratifiedKFold
+
+BOOTSTRAP_METRICS = ("accuracy", "precision", "recall", "f1")
+
+# Resamples per worker task; fixed so results do not depend on the number of cores.
+BOOTSTRAP_CHUNK = 1000
+
+
+def _safe_div(num, den):
+    return np.divide(num, den, out=np.zeros(num.shape, dtype=float), where=den > 0)
+
+
+def binary_metrics(y_true, y_pred):
+    """Binary classification metrics along the last axis.
+
+    `y_true` / `y_pred` may be 1-D (one sample) or 2-D (one resample per row); the
+    confusion counts are computed with array reductions so a whole resample matrix is
+    scored at once.
+    """
+    y_true = np.asarray(y_true, dtype=bool)
+    y_pred = np.asarray(y_pred, dtype=bool)
+    n = y_true.shape[-1]
+    tp = np.count_nonzero(y_true & y_pred, axis=-1)
+    fp = np.count_nonzero(~y_true & y_pred, axis=-1)
+    fn = np.count_nonzero(y_true & ~y_pred, axis=-1)
+    tn = n - tp - fp - fn
+    tp, fp, fn = np.asarray(tp, dtype=float), np.asarray(fp, dtype=float), np.asarray(fn, dtype=float)
+    return {
+        "accuracy": (tp + tn) / n,
+        "precision": _safe_div(tp, tp + fp),
+        "recall": _safe_div(tp, tp + fn),
+        "f1": _safe_div(2 * tp, 2 * tp + fp + fn),
+    }
+
+
+def _bootstrap_chunk(y_true, y_pred, n_resamples, seed):
+    rng = np.random.default_rng(seed)
+    idx = rng.integers(0, len(y_true), size=(n_resamples, len(y_true)))
+    return binary_metrics(y_true[idx], y_pred[idx])
+
+
+def bootstrap_metrics(
+    y_true,
+    y_pred,
+    n_resamples: int = 2000,
+    confidence: float = 0.95,
+    random_state: int = 42,
+    n_jobs: int = -1,
+) -> Dict[str, Dict[str, float]]:
+    """Percentile bootstrap confidence intervals for holdout metrics.
+
+    Resamples are drawn as an index matrix and scored in batches; batches run in
+    parallel threads (NumPy releases the GIL for the heavy array work).
+    """
+    y_true = np.asarray(y_true).astype(bool)
+    y_pred = np.asarray(y_pred).astype(bool)
+    if len(y_true) == 0:
+        raise ValueError("Cannot bootstrap an empty sample.")
+    if n_resamples < 1:
+        raise ValueError(f"n_resamples must be at least 1, got {n_resamples}.")
+    if not 0 < confidence < 1:
+        raise ValueError(f"confidence must be between 0 and 1, got {confidence}.")
+
+    sizes = [BOOTSTRAP_CHUNK] * (n_resamples // BOOTSTRAP_CHUNK)
+    if n_resamples % BOOTSTRAP_CHUNK:
+        sizes.append(n_resamples % BOOTSTRAP_CHUNK)
+    seeds = np.random.SeedSequence(random_state).spawn(len(sizes))
+    chunks = Parallel(n_jobs=n_jobs, prefer="threads")(
+        delayed(_bootstrap_chunk)(y_true, y_pred, sizes[i], seeds[i]) for i in range(len(sizes))
+    )
+
+    point = binary_metrics(y_true, y_pred)
+    tail = (1.0 - confidence) / 2 * 100
+    out = {}
+    for name in BOOTSTRAP_METRICS:
+        samples = np.concatenate([c[name] for c in chunks])
+        low, high = np.percentile(samples, [tail, 100 - tail])
+        out[name] = {"estimate": float(point[name]), "ci_low": float(low), "ci_high": float(high)}
+    return out
+
+
+def _take(a, idx):
+    return a.iloc[idx] if hasattr(a, "iloc") else np.asarray(a)[idx]
+
+
+def _fit_score(estimator, X, y, train, test):
+    est = clone(estimator).fit(_take(X, train), _take(y, train))
+    m = binary_metrics(_take(y, test), est.predict(_take(X, test)))
+    return float(m["accuracy"]), float(m["f1"])
+
+
+def repeated_cv_compare(
+    estimators: Dict[str, Any],
+    X,
+    y,
+    n_splits: int = 5,
+    n_repeats: int = 10,
+    random_state: int = 42,
+    n_jobs: int = -1,
+) -> Dict[str, Dict[str, Any]]:
+    """Accuracy / F1 of several estimators over the same repeated stratified K-fold splits.
+
+    Every (estimator, fold) fit is a task in a single joblib pool, so small models do not
+    leave cores idle waiting for a slow one to finish its folds.
+    """
+    folds = list(
+        RepeatedStratifiedKFold(n_splits=n_splits, n_repeats=n_repeats, random_state=random_state).split(X, y)
+    )
+    names = list(estimators)
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(_fit_score)(estimators[name], X, y, train, test) for name in names for train, test in folds
+    )
+
+    out = {}
+    for i, name in enumerate(names):
+        scores = np.array(results[i * len(folds):(i + 1) * len(folds)])
+        summary: Dict[str, Any] = {"n_splits": n_splits, "n_repeats": n_repeats}
+        for j, metric in enumerate(("accuracy", "f1")):
+            s = scores[:, j]
+            summary[metric] = {"mean": float(s.mean()), "std": float(s.std(ddof=1)), "min": float(s.min()), "max": float(s.max())}
+        out[name] = summary
+    return out
+
+
+def repeated_cv_scores(
+    estimator,
+    X,
+    y,
+    n_splits: int = 5,
+    n_repeats: int = 10,
+    random_state: int = 42,
+    n_jobs: int = -1,
+) -> Dict[str, Any]:
+    """Accuracy / F1 over repeated stratified K-fold, fitted across all cores."""
+    return repeated_cv_compare(
+        {"model": estimator}, X, y, n_splits=n_splits, n_repeats=n_repeats, random_state=random_state, n_jobs=n_jobs
+    )["model"]
@@ -4,6 +4,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, Any, Tuple
 import pandas as pd
+from sklearn.base import clone
 from sklearn.model_selection import train_test_split, GridSearchCV
 from sklearn.metrics import accuracy_score, f1_score, confusion_matrix, classification_report
 from sklearn.pipeline import Pipeline
@@ -13,6 +14,8 @@ from sklearn.svm import SVC
 from sklearn.tree import DecisionTreeClassifier
 from sklearn.neighbors import KNeighborsClassifier
 
+from spacex_landing.evaluation import bootstrap_metrics, repeated_cv_compare
+
 MODELS = {
     "logreg": LogisticRegression(max_iter=5000),
     "svm": SVC(probability=True),
@@ -27,6 +30,9 @@ PARAM_GRIDS = {
     "knn": {"clf__n_neighbors": [3, 5, 7, 9]},
 }
 
+# Inner folds of the grid search refit inside every outer CV fold during model selection.
+NESTED_INNER_CV = 3
+
 @dataclass
 class TrainResult:
     best_name: str
@@ -40,36 +46,60 @@ def split_xy(df, target):
     y = df[target].astype(int)
     return X, y
 
+def _selection_estimator(name, clf):
+    """Grid search refit in each outer fold of the nested CV.
+
+    Selection only needs predicted labels, so SVC's Platt scaling (five extra internal fits
+    per fit) is switched off, and the inner search uses fewer folds.
+    """
+    if "probability" in clf.get_params():
+        clf = clone(clf).set_params(probability=False)
+    pipe = Pipeline([("scaler", StandardScaler(with_mean=False)), ("clf", clf)])
+    return GridSearchCV(pipe, PARAM_GRIDS[name], cv=NESTED_INNER_CV)
+
 def train_best_model(
     df: pd.DataFrame,
     target: str = "Class",
     test_size: float = 0.2,
     random_state: int = 42,
+    cv_repeats: int = 5,
+    n_resamples: int = 2000,
 ) -> TrainResult:
+    """Pick the model with the best repeated-CV accuracy, then grid-search it on the training split.
+
+    Selection uses nested CV on the training split rather than the single holdout, which is
+    too small to rank models reliably: the whole grid search is refit inside every outer
+    fold of a repeated stratified K-fold, so the score is not inflated by tuning on the same
+    rows (which would favour the larger grids). Every model's CV summary is returned under
+    `model_selection`; the holdout metrics of the winner get bootstrap confidence intervals.
+    """
     X, y = split_xy(df, target=target)
     X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=random_state, stratify=y)
 
-    best_overall = None
-    best_name = None
-    best_acc = -1.0
-    best_metrics = {}
-
-    for name, clf in MODELS.items():
-        pipe = Pipeline([("scaler", StandardScaler(with_mean=False)), ("clf", clf)])
-        grid = GridSearchCV(pipe, PARAM_GRIDS[name], cv=5, n_jobs=-1)
-        grid.fit(X_train, y_train)
-        pred = grid.predict(X_test)
+    # Inner searches run single-threaded; all (model, outer fold) fits share one pool.
+    # Plain arrays skip sklearn's per-call DataFrame validation, which dominates these tiny fits.
+    model_selection = repeated_cv_compare(
+        {name: _selection_estimator(name, clf) for name, clf in MODELS.items()},
+        X_train.to_numpy(dtype=float),
+        y_train.to_numpy(),
+        n_repeats=cv_repeats,
+        random_state=random_state,
+    )
 
-        metrics = {
-            "accuracy": float(accuracy_score(y_test, pred)),
-            "f1": float(f1_score(y_test, pred)),
-            "confusion_matrix": confusion_matrix(y_test, pred).tolist(),
-            "report": classification_report(y_test, pred, output_dict=True),
-        }
-        if metrics["accuracy"] > best_acc:
-            best_acc = metrics["accuracy"]
-            best_overall = grid.best_estimator_
-            best_name = name
-            best_metrics = metrics
+    # first model wins ties, in MODELS order
+    best_name = max(MODELS, key=lambda name: model_selection[name]["accuracy"]["mean"])
+    pipe = Pipeline([("scaler", StandardScaler(with_mean=False)), ("clf", MODELS[best_name])])
+    grid = GridSearchCV(pipe, PARAM_GRIDS[best_name], cv=5, n_jobs=-1)
+    grid.fit(X_train, y_train)
+    pred = grid.predict(X_test)
 
-    return TrainResult(best_name=best_name, best_estimator=best_overall, metrics=best_metrics)
+    metrics = {
+        "accuracy": float(accuracy_score(y_test, pred)),
+        "f1": float(f1_score(y_test, pred)),
+        "confusion_matrix": confusion_matrix(y_test, pred).tolist(),
+        "report": classification_report(y_test, pred, output_dict=True),
+        "cv": model_selection[best_name],
+        "model_selection": model_selection,
+        "confidence_intervals": bootstrap_metrics(y_test, pred, n_resamples=n_resamples, random_state=random_state),
+    }
+    return TrainResult(best_name=best_name, best_estimator=grid.best_estimator_, metrics=metrics)
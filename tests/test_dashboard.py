@@ -0,0 +1,66 @@
+import warnings
+
+import numpy as np
+from dash import no_update
+
+from spacex_landing.dashboard.app import _zoom_range, make_scatter_figure, update_scatter_figure
+from spacex_landing.dashboard.synthetic import synthetic_launches
+
+GRAPH = "success-payload-scatter-chart"
+BINNING = {"webgl_threshold": 100, "max_points": 1000, "bins": 10}
+
+def test_small_table_keeps_svg_scatter():
+    fig = make_scatter_figure(synthetic_launches(50), "ALL", [0, 10000])
+    assert {t.type for t in fig.data} == {"scatter"}
+
+def test_large_table_uses_binned_webgl():
+    fig = make_scatter_figure(synthetic_launches(5000), "ALL", [0, 10000], **BINNING)
+    assert {t.type for t in fig.data} == {"scattergl"}
+    assert sum(len(t.x) for t in fig.data) <= 5 * 2 * 10
+    assert sum(int(c) for t in fig.data for c in t.customdata) == 5000
+    assert '"bdata"' in fig.to_json()
+
+def test_colors_stable_across_render_modes():
+    df = synthetic_launches(500)
+    svg = make_scatter_figure(df, "ALL", [0, 10000], render_mode="svg")
+    gl = make_scatter_figure(df, "ALL", [0, 10000], render_mode="webgl")
+    assert {t.name: t.marker.color for t in svg.data} == {t.name: t.marker.color for t in gl.data}
+
+def test_zoom_on_small_table_is_left_to_plotly():
+    zoom = {"xaxis.range[0]": 1000, "xaxis.range[1]": 2000}
+    out = update_scatter_figure(synthetic_launches(56), "ALL", [0, 10000], zoom, GRAPH)
+    assert out is no_update
+
+def test_zoom_on_unbinned_webgl_is_left_to_plotly():
+    zoom = {"xaxis.range[0]": 1000, "xaxis.range[1]": 2000}
+    df = synthetic_launches(5000)
+    assert update_scatter_figure(df, "ALL", [0, 10000], zoom, GRAPH) is no_update
+    fig = make_scatter_figure(df, "ALL", [0, 10000], x_range=(1000, 2000))
+    assert {t.type for t in fig.data} == {"scattergl"}
+    assert sum(len(t.x) for t in fig.data) == 5000
+
+def test_missing_payloads_are_not_binned():
+    df = synthetic_launches(5000)
+    df.loc[:99, "Payload Mass (kg)"] = np.nan
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        fig = make_scatter_figure(df, **BINNING)
+    assert sum(int(c) for t in fig.data for c in t.customdata) == 4900
+
+def test_zoom_on_webgl_rebins_window():
+    zoom = {"xaxis.range[0]": 1000, "xaxis.range[1]": 2000}
+    fig = update_scatter_figure(synthetic_launches(20000), "ALL", [0, 10000], zoom, GRAPH, **BINNING)
+    assert list(fig.layout.xaxis.range) == [1000, 2000]
+    assert fig.layout.uirevision is not None
+    assert all(1000 <= x <= 2000 for t in fig.data for x in t.x)
+
+def test_autorange_resets_to_overview():
+    fig = update_scatter_figure(
+        synthetic_launches(20000), "ALL", [0, 10000], {"xaxis.autorange": True}, GRAPH, **BINNING
+    )
+    assert fig.layout.xaxis.range is None
+    assert sum(int(c) for t in fig.data for c in t.customdata) == 20000
+
+def test_zoom_range():
+    assert _zoom_range({"xaxis.range[0]": 10, "xaxis.range[1]": 20}) == (10.0, 20.0)
+    assert _zoom_range({"xaxis.autorange": True}) is None
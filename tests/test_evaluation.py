@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score, f1_score
+from sklearn.model_selection import RepeatedStratifiedKFold, cross_validate
+
+from spacex_landing.evaluation import binary_metrics, bootstrap_metrics, repeated_cv_scores
+from spacex_landing.modeling import train_best_model
+
+
+def test_binary_metrics_matches_sklearn_per_row():
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, (5, 30))
+    y_pred = rng.integers(0, 2, (5, 30))
+    out = binary_metrics(y_true, y_pred)
+    for i in range(5):
+        assert np.isclose(out["accuracy"][i], accuracy_score(y_true[i], y_pred[i]))
+        assert np.isclose(out["f1"][i], f1_score(y_true[i], y_pred[i]))
+
+def test_bootstrap_ci_independent_of_jobs():
+    y_true = np.array([1, 0, 1, 1, 0, 1, 0, 1, 1, 0] * 2)
+    y_pred = np.array([1, 0, 0, 1, 0, 1, 1, 1, 1, 0] * 2)
+    a = bootstrap_metrics(y_true, y_pred, n_resamples=2500, n_jobs=1)
+    b = bootstrap_metrics(y_true, y_pred, n_resamples=2500, n_jobs=2)
+    assert a == b
+    assert a["accuracy"]["ci_low"] <= a["accuracy"]["estimate"] <= a["accuracy"]["ci_high"]
+
+def test_repeated_cv_matches_cross_validate():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(60, 3))
+    y = (X[:, 0] + rng.normal(0, 0.5, 60) > 0).astype(int)
+    out = repeated_cv_scores(LogisticRegression(), X, y, n_repeats=3, n_jobs=1)
+    cv = RepeatedStratifiedKFold(n_splits=5, n_repeats=3, random_state=42)
+    ref = cross_validate(LogisticRegression(), X, y, cv=cv, scoring=("accuracy", "f1"))
+    assert np.isclose(out["accuracy"]["mean"], ref["test_accuracy"].mean())
+    assert np.isclose(out["f1"]["std"], ref["test_f1"].std(ddof=1))
+
+def test_train_best_model_reports_intervals():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"PayloadMass": rng.uniform(0, 10000, 90), "Flights": rng.integers(1, 5, 90)})
+    df["Class"] = (df["PayloadMass"] + rng.normal(0, 2000, 90) > 5000).astype(int)
+    result = train_best_model(df, cv_repeats=2, n_resamples=500)
+    assert set(result.metrics["confidence_intervals"]) == {"accuracy", "precision", "recall", "f1"}
+    assert result.metrics["cv"]["n_repeats"] == 2
+    assert set(result.metrics["model_selection"]) == {"logreg", "svm", "dt", "knn"}
+    assert result.metrics["model_selection"][result.best_name] == result.metrics["cv"]
+
+@pytest.mark.parametrize("kwargs", [{"n_resamples": 0}, {"confidence": 1.0}, {"confidence": 0}])
+def test_bootstrap_rejects_bad_arguments(kwargs):
+    with pytest.raises(ValueError):
+        bootstrap_metrics([1, 0, 1], [1, 1, 0], **kwargs)